@@ -1,27 +1,48 @@
+from __future__ import annotations
+
 import os
+import hashlib
 import json
 import time
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 from io import BytesIO
 from functools import lru_cache
+import queue
 import signal
-from typing import Generator
+import sys
+import threading
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Generator
 import webbrowser
 import logging
 import inspect
 
-from PIL import Image
-import spotipy
 import xdg
-import requests
 from loguru import logger
-from smartscreen_driver.lcd_comm_rev_a import LcdCommRevA, Orientation
-from smartscreen_driver.lcd_simulated import LcdSimulated
-from pidili import Pidili
-from pidili.widgets import Widget, Text, Img, Rect, ProgressBar
+
+# the heavy third-party imports (PIL, spotipy, requests, pidili, the LCD
+# driver) are deferred to the functions that first need them: on the small
+# ARM boards this typically runs on they add seconds of startup before the
+# config prompt can even appear
+if TYPE_CHECKING:
+    import requests
+    import spotipy
+    from PIL import Image
+    from pidili.widgets import Widget
 
 
 class InterceptHandler(logging.Handler):
+    # the stack depth from emit() down to the logging caller is the same for
+    # every record going through the standard `logging` machinery, so cache
+    # it after the first walk and only re-walk when it stops lining up
+    _depth: int | None = None
+
+    @staticmethod
+    def _is_internal(filename: str) -> bool:
+        is_logging = filename == logging.__file__
+        is_frozen = "importlib" in filename and "_bootstrap" in filename
+        return is_logging or is_frozen
+
     def emit(self, record: logging.LogRecord) -> None:
         # Get corresponding Loguru level if it exists.
         try:
@@ -30,15 +51,27 @@ class InterceptHandler(logging.Handler):
             level = record.levelno
 
         # Find caller from where originated the logged message.
-        frame, depth = inspect.currentframe(), 0
-        while frame:
-            filename = frame.f_code.co_filename
-            is_logging = filename == logging.__file__
-            is_frozen = "importlib" in filename and "_bootstrap" in filename
-            if depth > 0 and not (is_logging or is_frozen):
-                break
-            frame = frame.f_back
-            depth += 1
+        depth = InterceptHandler._depth
+        if depth is not None:
+            # cheap validation that the cached depth still points just past
+            # the logging internals; anything else means the record took a
+            # different path and we need the full walk again
+            try:
+                ok = not self._is_internal(
+                    sys._getframe(depth).f_code.co_filename
+                ) and self._is_internal(sys._getframe(depth - 1).f_code.co_filename)
+            except ValueError:
+                ok = False
+            if not ok:
+                depth = None
+        if depth is None:
+            frame, depth = inspect.currentframe(), 0
+            while frame:
+                if depth > 0 and not self._is_internal(frame.f_code.co_filename):
+                    break
+                frame = frame.f_back
+                depth += 1
+            InterceptHandler._depth = depth
 
         logger.opt(depth=depth, exception=record.exc_info).log(
             level, record.getMessage()
@@ -48,6 +81,19 @@ class InterceptHandler(logging.Handler):
 logging.basicConfig(handlers=[InterceptHandler()], level=logging.INFO, force=True)
 
 
+def patch_requests_json_decoder():
+    """spotipy parses every API response through requests' Response.json();
+    swap the decoder for orjson's C implementation. Encoding stays on the
+    stdlib: orjson.dumps returns bytes and doesn't accept the keyword
+    arguments requests passes to it."""
+    import orjson
+    import requests
+
+    requests.models.complexjson = SimpleNamespace(
+        loads=orjson.loads, dumps=json.dumps
+    )
+
+
 @dataclass
 class Config:
     client_id: str = ""
@@ -58,9 +104,11 @@ class Config:
 
     @classmethod
     def load(cls, path: os.PathLike) -> "Config":
+        import orjson
+
         try:
-            with open(path) as f:
-                return cls(**json.load(f))
+            with open(path, "rb") as f:
+                return cls(**orjson.loads(f.read()))
         except FileNotFoundError:
             logger.info(f"No config file found, creating one in {path}")
             return cls()
@@ -69,8 +117,36 @@ class Config:
             return cls()
 
     def save(self, path: os.PathLike):
-        with open(path, "w") as f:
-            json.dump(asdict(self), f, indent=2)
+        import orjson
+
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(asdict(self), option=orjson.OPT_INDENT_2))
+
+
+def make_token_cache_handler(token_file: os.PathLike) -> "spotipy.CacheHandler":
+    """Build a CacheFileHandler that keeps the token in memory, so spotipy's
+    check-token-before-every-call only touches the file once at startup and
+    then on refreshes, instead of reading it back on every API call.
+
+    Defined in a factory because the base class can't be named before
+    spotipy is imported."""
+    import spotipy
+
+    class MemoryCachedFileHandler(spotipy.cache_handler.CacheFileHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._token_info: dict | None = None
+
+        def get_cached_token(self):
+            if self._token_info is None:
+                self._token_info = super().get_cached_token()
+            return self._token_info
+
+        def save_token_to_cache(self, token_info):
+            self._token_info = token_info
+            super().save_token_to_cache(token_info)
+
+    return MemoryCachedFileHandler(cache_path=str(token_file))
 
 
 def main():
@@ -80,6 +156,8 @@ def main():
     config_file = app_config_dir / "config.json"
     token_file = app_config_dir / "token.json"
 
+    evict_album_art_cache()
+
     cfg = Config.load(config_file)
     if not cfg.client_id:
         cfg.client_id = input("Please enter your Spotify app's client ID: ").strip()
@@ -89,14 +167,16 @@ def main():
         ).strip()
     cfg.save(config_file)
 
+    import spotipy
+
+    patch_requests_json_decoder()
+
     scope = "user-read-playback-state"
     credentials_manager = spotipy.oauth2.SpotifyPKCE(
         scope=scope,
         client_id=cfg.client_id,
         redirect_uri=cfg.redirect_uri,
-        cache_handler=spotipy.cache_handler.CacheFileHandler(
-            cache_path=str(token_file)
-        ),
+        cache_handler=make_token_cache_handler(token_file),
     )
     spot = spotipy.Spotify(client_credentials_manager=credentials_manager)
     # spotipy doesn't actually try to connect until an API call is made, so
@@ -104,12 +184,22 @@ def main():
     # if needed, before trying to connect to the screen
     spot.current_playback()
 
-    run(cfg, spot)
+    run(cfg, spot, credentials_manager)
+
+
+# sentinel telling the paint thread to exit (None is already taken: it asks
+# for a pidili reset)
+_PAINT_STOP = object()
 
 
 class Screen:
     def __init__(self, cfg: Config):
+        from pidili import Pidili
+        from smartscreen_driver.lcd_comm_rev_a import LcdCommRevA, Orientation
+
         if cfg.simulated:
+            from smartscreen_driver.lcd_simulated import LcdSimulated
+
             self.lcd = LcdSimulated()
             host, port = self.lcd.webServer.server_address
             url = f"http://{host}:{port}"
@@ -125,10 +215,48 @@ class Screen:
         self.is_on = True
         self.pdl = Pidili(self.lcd.paint)
 
+        # painting the LCD is slow serial I/O (tens of ms for a full
+        # update), so it runs on its own thread; the queue holds a single
+        # scene and update() drops the older one when a newer one arrives.
+        # pdl is only ever touched from this thread once it's started
+        self._paint_queue: queue.Queue = queue.Queue(maxsize=1)
+        self._paint_error: Exception | None = None
+        self._last_scene: Widget | None = None
+        self._paint_thread = threading.Thread(target=self._paint_loop, daemon=True)
+        self._paint_thread.start()
+
+    def _paint_loop(self):
+        while True:
+            scene = self._paint_queue.get()
+            try:
+                if scene is _PAINT_STOP:
+                    return
+                if scene is None:
+                    self.pdl.reset()
+                else:
+                    self.pdl.update(scene)
+            except Exception as e:
+                # surface the error on the next update() call, so the main
+                # loop's retry logic kicks in as if painting were synchronous
+                self._paint_error = e
+            finally:
+                self._paint_queue.task_done()
+
+    def close(self):
+        """Stop the paint thread. The screen must not be used afterwards."""
+        self._paint_queue.put(_PAINT_STOP)
+        # the worker could be stuck in a paint on a dead serial link; it's a
+        # daemon thread, so don't wait on it forever
+        self._paint_thread.join(timeout=5)
+
     def off(self):
         if not self.is_on:
             return
-        self.pdl.reset()
+        # the None sentinel makes the worker reset pidili's state; wait for
+        # the queue to drain so we don't paint over a blanked screen
+        self._paint_queue.put(None)
+        self._paint_queue.join()
+        self._last_scene = None
         self.lcd.screen_off()
         self.lcd.clear()
         self.is_on = False
@@ -143,17 +271,123 @@ class Screen:
         return self.lcd.size()
 
     def update(self, scene: Widget):
-        self.pdl.update(scene)
+        if self._paint_error is not None:
+            error, self._paint_error = self._paint_error, None
+            raise error
+        if scene is self._last_scene:
+            # build_scene returns the very same object when nothing visible
+            # changed; don't even wake the paint thread for it
+            return
+        self._last_scene = scene
+        try:
+            self._paint_queue.put_nowait(scene)
+        except queue.Full:
+            # the worker is still painting the previous scene; drop it in
+            # favor of the fresher one
+            try:
+                self._paint_queue.get_nowait()
+                self._paint_queue.task_done()
+            except queue.Empty:
+                pass
+            self._paint_queue.put_nowait(scene)
+
+
+ART_CACHE_DIR = xdg.xdg_cache_home() / "spotiscreen" / "art"
+ART_CACHE_MAX_FILES = 256
+
+# reuse HTTPS connections to the album art host instead of paying a TLS
+# handshake per download
+_session: requests.Session | None = None
+
+
+def _get_session() -> requests.Session:
+    global _session
+    if _session is None:
+        import requests
+
+        _session = requests.Session()
+        _session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4),
+        )
+    return _session
+
+
+def evict_album_art_cache():
+    """Keep the on-disk album art cache bounded by removing the least
+    recently used files."""
+    try:
+        entries = os.listdir(ART_CACHE_DIR)
+    except FileNotFoundError:
+        return
+    excess = len(entries) - ART_CACHE_MAX_FILES
+    if excess <= 0:
+        return
+    entries.sort(key=lambda name: os.stat(ART_CACHE_DIR / name).st_atime)
+    for name in entries[:excess]:
+        try:
+            os.remove(ART_CACHE_DIR / name)
+        except OSError as e:
+            logger.warning(f"Error evicting cached album art {name}: {e}")
+
+
+# the size at which album art is displayed on screen
+ART_SIZE = (255, 255)
 
 
 @lru_cache(maxsize=32)
-def download_image(url: str) -> Image.Image:
-    response = requests.get(url)
-    response.raise_for_status()
-    return Image.open(BytesIO(response.content))
+def _fetch_image(url: str) -> Image.Image:
+    from PIL import Image
+
+    # album art is cached on disk keyed by the URL, so it survives restarts;
+    # the lru_cache on top keeps the decoded images of recent tracks in memory
+    path = ART_CACHE_DIR / hashlib.sha1(url.encode()).hexdigest()
+    if path.exists():
+        img = Image.open(path)
+    else:
+        # explicit timeouts so a stalled connection can't hang the ticker
+        # forever
+        response = _get_session().get(url, timeout=(3, 5))
+        response.raise_for_status()
+        os.makedirs(ART_CACHE_DIR, exist_ok=True)
+        # write-then-rename so a crash mid-write can't leave a truncated
+        # file behind that would be mistaken for a valid cache entry
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(response.content)
+        os.replace(tmp_path, path)
+        img = Image.open(BytesIO(response.content))
+    # decode and downscale to display size once, here, so the render path
+    # never has to touch the full-resolution image again
+    return img.convert("RGB").resize(ART_SIZE, Image.LANCZOS)
+
+
+# downloads in flight, keyed by URL; lru_cache doesn't deduplicate concurrent
+# misses, so without this two threads asking for the same URL at the same time
+# would both download it
+_inflight: dict[str, threading.Event] = {}
+_inflight_lock = threading.Lock()
 
 
-@dataclass
+def download_image(url: str) -> Image.Image:
+    while True:
+        with _inflight_lock:
+            event = _inflight.get(url)
+            if event is None:
+                _inflight[url] = threading.Event()
+                break
+        # another thread is fetching this URL; wait for it, then go through
+        # the cache ourselves
+        event.wait()
+    try:
+        return _fetch_image(url)
+    finally:
+        with _inflight_lock:
+            _inflight.pop(url).set()
+
+
+# slots to keep the per-tick allocation small, frozen so an instance can
+# safely be shared between ticks and only replaced, never mutated
+@dataclass(slots=True, frozen=True)
 class NowPlayingState:
     artist: str
     track_name: str
@@ -174,16 +408,18 @@ class NowPlayingState:
             logger.warning(f"Error downloading album art: {e}")
             album_art_img = None
 
+        # positional, in field order: cheaper than keyword construction in
+        # the hottest per-tick allocation
         return cls(
-            artist=api_resp["item"]["artists"][0]["name"],
-            track_name=api_resp["item"]["name"],
-            album=api_resp["item"]["album"]["name"],
-            progress_ms=api_resp["progress_ms"],
-            duration_ms=api_resp["item"]["duration_ms"],
-            track_number=api_resp["item"]["track_number"],
-            total_tracks=api_resp["item"]["album"]["total_tracks"],
-            album_art_url=album_art_url,
-            album_art_img=album_art_img,
+            api_resp["item"]["artists"][0]["name"],
+            api_resp["item"]["name"],
+            api_resp["item"]["album"]["name"],
+            album_art_url,
+            album_art_img,
+            api_resp["progress_ms"],
+            api_resp["item"]["duration_ms"],
+            api_resp["item"]["track_number"],
+            api_resp["item"]["album"]["total_tracks"],
         )
 
     def progress_percent(self) -> float:
@@ -191,63 +427,88 @@ class NowPlayingState:
 
 
 def ms_to_min_secs(ms: int) -> str:
-    seconds = ms // 1000
-    minutes = seconds // 60
-    seconds = seconds % 60
+    # memoized on whole seconds so the cache stays dense: a track's elapsed
+    # time only ever produces a few hundred distinct values
+    return _min_secs(ms // 1000)
+
+
+@lru_cache(maxsize=1024)
+def _min_secs(seconds: int) -> str:
+    minutes, seconds = divmod(seconds, 60)
     return f"{minutes}:{seconds:02d}"
 
 
 def ticker(interval: float) -> Generator[None, None, None]:
-    next_tick = time.time() + interval
+    # deadline-based schedule on the monotonic clock: immune to NTP steps,
+    # and sleep times are computed from the deadline so the cadence doesn't
+    # drift by the time spent in the loop body
+    deadline = time.monotonic()
     while True:
         yield
-        now = time.time()
-        if now > next_tick:
-            next_tick = now + interval
+        deadline += interval
+        sleep = deadline - time.monotonic()
+        if sleep > 0:
+            time.sleep(sleep)
         else:
-            time.sleep(next_tick - now)
-            next_tick += interval
+            # running behind; catch up from now instead of stacking up
+            # missed ticks
+            deadline = time.monotonic()
 
 
-def build_scene(cfg: Config, size: tuple[int, int], state: NowPlayingState) -> Widget:
-    scene = Rect(size, fill=(0, 0, 0))
+# the widgets that only change on track change, cached with the identity of
+# the track they were built for, so steady-state ticks don't re-create (and
+# re-layout) them just to move the progress bar
+_static_widgets: tuple[tuple, list[tuple[tuple[int, int], Widget]]] | None = None
+
+
+def build_static_widgets(
+    cfg: Config, state: NowPlayingState
+) -> list[tuple[tuple[int, int], Widget]]:
+    global _static_widgets
+
+    identity = (
+        state.album_art_url,
+        state.track_name,
+        state.album,
+        state.artist,
+        state.duration_ms,
+        state.track_number,
+        state.total_tracks,
+        state.album_art_img is not None,
+    )
+    if _static_widgets is not None and _static_widgets[0] == identity:
+        return _static_widgets[1]
+
+    from pidili.widgets import Img, Text
+
+    widgets: list[tuple[tuple[int, int], Widget]] = []
     if state.album_art_img:
-        scene.add(
-            (0, 0),
-            Img((255, 255), state.album_art_img, key=state.album_art_url),
+        widgets.append(
+            ((0, 0), Img(ART_SIZE, state.album_art_img, key=state.album_art_url))
+        )
+    widgets.append(
+        (
+            (475, 290),
+            Text(
+                ms_to_min_secs(int(state.duration_ms)),
+                color=(200, 200, 200),
+                font=cfg.font,
+                font_size=20,
+                anchor="ra",
+            ),
         )
-    scene.add(
-        (0, 270),
-        ProgressBar((480, 5), state.progress_percent(), fill=(64, 64, 64)),
-    )
-    scene.add(
-        (5, 290),
-        Text(
-            ms_to_min_secs(int(state.progress_ms)),
-            color=(200, 200, 200),
-            font=cfg.font,
-            font_size=20,
-        ),
-    )
-    scene.add(
-        (475, 290),
-        Text(
-            ms_to_min_secs(int(state.duration_ms)),
-            color=(200, 200, 200),
-            font=cfg.font,
-            font_size=20,
-            anchor="ra",
-        ),
     )
-    scene.add(
-        (240, 290),
-        Text(
-            f"{state.track_number} / {state.total_tracks}",
-            color=(200, 200, 200),
-            font=cfg.font,
-            font_size=20,
-            anchor="ma",
-        ),
+    widgets.append(
+        (
+            (240, 290),
+            Text(
+                f"{state.track_number} / {state.total_tracks}",
+                color=(200, 200, 200),
+                font=cfg.font,
+                font_size=20,
+                anchor="ma",
+            ),
+        )
     )
     album = Text(
         state.album,
@@ -256,44 +517,143 @@ def build_scene(cfg: Config, size: tuple[int, int], state: NowPlayingState) -> W
         font_size=16,
         max_width=215,
     )
-
-    scene.add(
-        (265, 2),
-        album,
+    widgets.append(((265, 2), album))
+    widgets.append(
+        (
+            (265, album.height + 20),
+            Text(
+                state.artist,
+                color=(255, 255, 255),
+                font=cfg.font,
+                font_size=24,
+                max_width=215,
+            ),
+        )
     )
-    scene.add(
-        (265, album.height + 20),
-        Text(
-            state.artist,
-            color=(255, 255, 255),
-            font=cfg.font,
-            font_size=24,
-            max_width=215,
-        ),
+    widgets.append(
+        (
+            (265, 255),
+            Text(
+                state.track_name,
+                font=cfg.font,
+                font_size=20,
+                max_width=215,
+                anchor="ld",
+                color=(255, 255, 255),
+            ),
+        )
     )
+
+    _static_widgets = (identity, widgets)
+    return widgets
+
+
+# last elapsed-time string and its widget; ticks often land in the same
+# wall-clock second, in which case the widget can be reused as-is
+_elapsed_cache: tuple[str, Widget] | None = None
+
+
+def elapsed_widget(cfg: Config, state: NowPlayingState) -> Widget:
+    global _elapsed_cache
+
+    elapsed = ms_to_min_secs(int(state.progress_ms))
+    if _elapsed_cache is None or _elapsed_cache[0] != elapsed:
+        from pidili.widgets import Text
+
+        _elapsed_cache = (
+            elapsed,
+            Text(
+                elapsed,
+                color=(200, 200, 200),
+                font=cfg.font,
+                font_size=20,
+            ),
+        )
+    return _elapsed_cache[1]
+
+
+# the last assembled scene along with what went into it; when every input is
+# unchanged (e.g. playback is paused, or two ticks land in the same second)
+# the exact same scene object is returned, which lets Screen.update skip the
+# paint entirely
+_scene_cache: tuple[tuple[int, int], list, Widget, float, Widget] | None = None
+
+
+def build_scene(cfg: Config, size: tuple[int, int], state: NowPlayingState) -> Widget:
+    from pidili.widgets import ProgressBar, Rect
+
+    global _scene_cache
+
+    statics = build_static_widgets(cfg, state)
+    elapsed = elapsed_widget(cfg, state)
+    percent = state.progress_percent()
+    if (
+        _scene_cache is not None
+        and _scene_cache[0] == size
+        # the statics list and elapsed widget are cached upstream, so an
+        # identity check is enough to know they're unchanged
+        and _scene_cache[1] is statics
+        and _scene_cache[2] is elapsed
+        and _scene_cache[3] == percent
+    ):
+        return _scene_cache[4]
+
+    scene = Rect(size, fill=(0, 0, 0))
+    for pos, widget in statics:
+        scene.add(pos, widget)
     scene.add(
-        (265, 255),
-        Text(
-            state.track_name,
-            font=cfg.font,
-            font_size=20,
-            max_width=215,
-            anchor="ld",
-            color=(255, 255, 255),
-        ),
+        (0, 270),
+        ProgressBar((480, 5), percent, fill=(64, 64, 64)),
     )
+    scene.add((5, 290), elapsed)
+    _scene_cache = (size, statics, elapsed, percent, scene)
     return scene
 
 
-def run(cfg: Config, spot: spotipy.Spotify):
+# refresh the OAuth token when it has less than this many seconds left, so
+# the main loop never trips on an expired-token error (which would tear the
+# screen down and back up through the retry path)
+TOKEN_REFRESH_MARGIN = 60
+
+_token_refresh_lock = threading.Lock()
+
+
+def maybe_refresh_token(creds: spotipy.oauth2.SpotifyPKCE):
+    with _token_refresh_lock:
+        token = creds.cache_handler.get_cached_token()
+        if not token:
+            return
+        # expires_at is wall-clock epoch time, so compare with time.time()
+        if token.get("expires_at", 0) - time.time() < TOKEN_REFRESH_MARGIN:
+            logger.info("Access token about to expire, refreshing it")
+            try:
+                creds.refresh_access_token(token["refresh_token"])
+            except Exception as e:
+                # not fatal: the token is still valid for a while, the next
+                # minute's check will retry, and spotipy refreshes on expiry
+                # as a last resort; don't fail the whole loop over it
+                logger.warning(f"Error refreshing access token: {e}")
+
+
+# poll the API again shortly before the expected end of the track, so track
+# changes are picked up promptly...
+TRACK_END_MARGIN_MS = 500
+# ... but still poll from time to time in between, to catch pauses, seeks and
+# manual track skips
+API_POLL_MAX_INTERVAL = 30
+
+
+def run(cfg: Config, spot: spotipy.Spotify, creds: spotipy.oauth2.SpotifyPKCE):
     logger.info("Starting")
     running = True
     screen = None
+    shutdown = threading.Event()
 
     def signal_handler(signum, frame):
         nonlocal running
         logger.info(f"Received signal {signum}, shutting down...")
         running = False
+        shutdown.set()
 
     # Register signal handlers
     signal.signal(signal.SIGINT, signal_handler)
@@ -304,28 +664,103 @@ def run(cfg: Config, spot: spotipy.Spotify):
             screen = Screen(cfg)
             logger.info("Screen initialized, now running...")
 
-            for _ in ticker(1):
+            # the last state returned by the API, when it was fetched, and
+            # whether playback was running at that point; between API polls
+            # the progress is interpolated locally
+            last_state: NowPlayingState | None = None
+            last_playing = False
+            last_poll = 0.0
+            # identity of the last response, to skip re-parsing it in full
+            # when only the progress moved
+            last_key = None
+
+            for tick, _ in enumerate(ticker(1)):
                 if not running:
                     break
-                current_playback = spot.current_playback()
-                if current_playback is None:
-                    screen.off()
-                    time.sleep(5)  # poll less often when nothing is playing
-                    continue
+
+                if tick % 60 == 0:
+                    maybe_refresh_token(creds)
+
+                now = time.monotonic()
+                state = None
+                if last_state is not None and last_playing:
+                    interpolated = last_state.progress_ms + int(
+                        (now - last_poll) * 1000
+                    )
+                    if (
+                        interpolated < last_state.duration_ms - TRACK_END_MARGIN_MS
+                        and now - last_poll <= API_POLL_MAX_INTERVAL
+                    ):
+                        # the track is still going, animate locally without
+                        # hitting the API
+                        state = replace(last_state, progress_ms=interpolated)
+
+                if state is None:
+                    current_playback = spot.current_playback()
+                    if current_playback is None:
+                        if last_state is not None:
+                            # could be a transient gap between tracks: keep
+                            # the screen as-is and confirm on the next tick
+                            # before turning it off
+                            last_state = None
+                            last_key = None
+                            continue
+                        screen.off()
+                        # poll less often when nothing is playing; wait on
+                        # the event rather than sleeping so a shutdown
+                        # signal interrupts it immediately
+                        shutdown.wait(5)
+                        continue
+                    key = (
+                        current_playback["item"]["id"],
+                        current_playback.get("is_playing", True),
+                        current_playback["item"]["duration_ms"],
+                    )
+                    expected = last_state.progress_ms if last_state else 0
+                    if last_state is not None and last_playing:
+                        expected += int((now - last_poll) * 1000)
+                    if (
+                        key == last_key
+                        and last_state is not None
+                        # a missing album art means the download failed; keep
+                        # taking the full parse path so it gets retried
+                        and last_state.album_art_img is not None
+                        and abs(current_playback["progress_ms"] - expected) < 1500
+                    ):
+                        # same track playing on as expected; just take the
+                        # fresh progress, no need to traverse the rest of
+                        # the response
+                        state = replace(
+                            last_state, progress_ms=current_playback["progress_ms"]
+                        )
+                    else:
+                        state = NowPlayingState.from_api_response(current_playback)
+                    last_state = state
+                    last_playing = key[1]
+                    last_poll = now
+                    last_key = key
+
                 screen.on()
-                now_playing_state = NowPlayingState.from_api_response(current_playback)
-                scene = build_scene(cfg, screen.size(), now_playing_state)
+                scene = build_scene(cfg, screen.size(), state)
                 screen.update(scene)
 
         except Exception as e:
             logger.error(f"Error occurred: {e}")
             logger.info("Retrying in 5 seconds...")
             if running:
-                time.sleep(5)
+                shutdown.wait(5)
+        finally:
+            # release the screen and its paint thread before the retry loop
+            # creates a new one; otherwise every retry would leak a thread
+            # (and the buffers it pins)
+            if screen:
+                try:
+                    screen.off()
+                except Exception as e:
+                    logger.warning(f"Error turning the screen off: {e}")
+                screen.close()
+                screen = None
 
-    # Clean up resources
-    if screen:
-        screen.off()
     logger.info("Shutdown complete")
 
 